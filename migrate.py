@@ -1,11 +1,119 @@
 #!/usr/bin/env python3
 import os
 import sys
-import json
-import requests
+import time
+import hashlib
+import orjson
+import asyncio
+import httpx
 import argparse
+from email.utils import parsedate_to_datetime
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter
 
 BASE_URL = "https://api.gremlin.com/v1"
+_EXTERNAL_INTEGRATIONS_URL = f"{BASE_URL}/external-integrations/status-check"
+_STATUS_CHECKS_URL = f"{BASE_URL}/status-checks"
+_SCENARIOS_URL = f"{BASE_URL}/scenarios"
+
+# Rate-limited (429) and transient server errors are retried with exponential
+# backoff, honouring any Retry-After header the API sends back.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# A 500/502/504 after a POST may mean the object was created anyway, so creates are only
+# resent when the server says it didn't process them.
+POST_RETRY_STATUSES = (429, 503)
+MAX_ATTEMPTS = 6
+# Upper bound in seconds for the exponential backoff. A server-supplied Retry-After is always
+# honoured in full; if it asks for longer than this we stop retrying and report the response.
+MAX_RETRY_WAIT = 30
+
+# Per-item creates/deletes are dispatched concurrently; this caps how many are in flight at once.
+MAX_CONCURRENCY = 10
+
+class GremlinClient:
+    # Pairs the shared httpx.AsyncClient with the limit on concurrent requests made through it.
+    # Every API function takes one of these as its client argument.
+    def __init__(self, http, max_concurrency=MAX_CONCURRENCY):
+        self.http = http
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+_backoff = wait_exponential_jitter(initial=0.5, max=MAX_RETRY_WAIT)
+
+def _parse_retry_after(value):
+    # Retry-After is either a number of seconds or an HTTP date.
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def _retry_wait(retry_state):
+    outcome = retry_state.outcome
+    if outcome is not None and not outcome.failed:
+        delay = _parse_retry_after(outcome.result().headers.get("Retry-After"))
+        if delay is not None:
+            return delay
+    return _backoff(retry_state)
+
+def _should_retry(retry_state):
+    outcome = retry_state.outcome
+    method = retry_state.args[1]
+    if not outcome.failed:
+        resp = outcome.result()
+        statuses = POST_RETRY_STATUSES if method == "POST" else RETRY_STATUSES
+        if resp.status_code not in statuses:
+            return False
+        # Retrying before Retry-After elapses would just burn attempts on more 429s.
+        delay = _parse_retry_after(resp.headers.get("Retry-After"))
+        return delay is None or delay <= MAX_RETRY_WAIT
+    exc = outcome.exception()
+    if method == "POST":
+        # A POST that timed out or broke mid-response may already have created the object;
+        # only resend it when the connection was never established.
+        return isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+    return isinstance(exc, httpx.TransportError)
+
+@retry(
+    wait=_retry_wait,
+    retry=_should_retry,
+    stop=stop_after_attempt(MAX_ATTEMPTS),
+    # Once attempts run out, return the last response (or re-raise the last error) rather than a RetryError.
+    retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+)
+async def _request(client, method, url, **kwargs):
+    async with client.semaphore:
+        return await client.http.request(method, url, **kwargs)
+
+def _load_json(body):
+    # Parse the raw response bytes with orjson; this skips the intermediate str decode
+    # that resp.json()/resp.text() would allocate for large scenario and check lists.
+    return orjson.loads(body)
+
+def _idempotency_headers(headers, team_id, identifier):
+    # Deterministic per-resource key so a retried DELETE is recognisably the same request.
+    key = hashlib.blake2b(f"{team_id}:{identifier}".encode(), digest_size=16).hexdigest()
+    return {**headers, "Idempotency-Key": key}
+
+def _report_errors(results, action):
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Error while {action}: {result}")
+
+# Server-managed fields dropped from source objects before they are recreated in the destination team.
+_HC_STRIP = frozenset({
+    "teamId", "identifier", "createdBy", "createdAt", "updatedBy", "updatedAt",
+    "thirdPartyPresets", "rawEndpointConfiguration"
+})
+# Scenarios also lose their shared linkage fields so they are treated as standalone, customized scenarios.
+_SCEN_STRIP = frozenset({
+    "teamId", "identifier", "createdBy", "createdAt", "updatedBy", "updatedAt",
+    "sharedScenario", "sharedScenarioGuid", "baseScenarioId",
+    "created_from_type", "created_from_id", "org_id"
+})
 
 ALLOWED_TYPES = {
     "JIRA", "DATADOG", "DATADOG_EU", "DATADOG_US3", "DATADOG_US5",
@@ -13,11 +121,12 @@ ALLOWED_TYPES = {
     "APPDYNAMICS", "CUSTOM", "K6", "LOAD_GENERATOR_CUSTOM", "AWS"
 }
 
-def get_external_integrations(team_id, headers):
-    url = f"{BASE_URL}/external-integrations/status-check?teamId={team_id}"
-    resp = requests.get(url, headers=headers)
+async def get_external_integrations(client, team_id, headers):
+    # Always fetches the team's full list: the endpoint's filter and pagination parameters are
+    # undocumented, and the cached destination list must stay complete for dedup and linking.
+    resp = await _request(client, "GET", _EXTERNAL_INTEGRATIONS_URL, headers=headers, params={"teamId": team_id})
     if resp.status_code == 200:
-        data = resp.json()
+        data = _load_json(resp.content)
         # If the response is already a list, return it; otherwise assume it's an object with key "integrations"
         if isinstance(data, list):
             return data
@@ -25,75 +134,107 @@ def get_external_integrations(team_id, headers):
             return data.get("integrations", [])
     else:
         print(f"Error fetching external integrations for team {team_id}: {resp.status_code} {resp.text}")
+        # None (not []) so callers can tell a failed fetch from a team with no integrations.
+        return None
+
+async def get_status_checks(client, team_id, headers):
+    resp = await _request(client, "GET", _STATUS_CHECKS_URL, headers=headers, params={"teamId": team_id})
+    if resp.status_code != 200:
+        print(f"Error fetching health checks for team {team_id}: {resp.status_code} {resp.text}")
+        return []
+    return _load_json(resp.content) or []
+
+async def get_scenarios(client, team_id, headers):
+    resp = await _request(client, "GET", _SCENARIOS_URL, headers=headers, params={"teamId": team_id})
+    if resp.status_code != 200:
+        print(f"Error fetching scenarios for team {team_id}: {resp.status_code} {resp.text}")
         return []
+    return _load_json(resp.content) or []
 
-def delete_existing_health_checks(team_id, headers):
+async def _delete_health_check(client, team_params, headers, identifier, name):
+    del_headers = _idempotency_headers(headers, team_params["teamId"], identifier)
+    del_resp = await _request(client, "DELETE", f"{_STATUS_CHECKS_URL}/{identifier}", headers=del_headers,
+                              params=team_params)
+    if del_resp.status_code in (200, 204):
+        print(f"Deleted health check: {name}")
+    else:
+        print(f"Failed to delete health check '{name}': {del_resp.status_code} {del_resp.text}")
+
+async def delete_existing_health_checks(client, team_id, headers):
     print(f"\nDeleting existing health checks from destination team {team_id}...")
-    url = f"{BASE_URL}/status-checks?teamId={team_id}"
-    resp = requests.get(url, headers=headers)
+    team_params = {"teamId": team_id}
+    resp = await _request(client, "GET", _STATUS_CHECKS_URL, headers=headers, params=team_params)
     if resp.status_code != 200:
         print(f"Error fetching health checks: {resp.text}")
         return
-    checks = resp.json()
+    checks = _load_json(resp.content)
     if not checks:
         print("No existing health checks found in destination team.")
         return
+    coros = []
     for check in checks:
         identifier = check.get("identifier")
         name = check.get("name", "Unnamed")
         if not identifier:
             continue
-        del_url = f"{BASE_URL}/status-checks/{identifier}?teamId={team_id}"
-        del_resp = requests.delete(del_url, headers=headers)
-        if del_resp.status_code in (200, 204):
-            print(f"Deleted health check: {name}")
-        else:
-            print(f"Failed to delete health check '{name}': {del_resp.status_code} {del_resp.text}")
+        coros.append(_delete_health_check(client, team_params, headers, identifier, name))
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    _report_errors(results, "deleting health checks")
+
+async def _delete_scenario(client, team_params, headers, scenario_id, name):
+    del_headers = _idempotency_headers(headers, team_params["teamId"], scenario_id)
+    del_resp = await _request(client, "DELETE", f"{_SCENARIOS_URL}/{scenario_id}", headers=del_headers,
+                              params=team_params)
+    if del_resp.status_code in (200, 204):
+        print(f"Deleted scenario: {name}")
+    else:
+        print(f"Failed to delete scenario '{name}': {del_resp.status_code} {del_resp.text}")
 
-def delete_existing_scenarios(team_id, headers):
+async def delete_existing_scenarios(client, team_id, headers):
     print(f"\nDeleting existing scenarios from destination team {team_id}...")
-    url = f"{BASE_URL}/scenarios?teamId={team_id}"
-    resp = requests.get(url, headers=headers)
+    team_params = {"teamId": team_id}
+    resp = await _request(client, "GET", _SCENARIOS_URL, headers=headers, params=team_params)
     if resp.status_code != 200:
         print(f"Error fetching scenarios: {resp.text}")
         return
-    scenarios = resp.json()
+    scenarios = _load_json(resp.content)
     if not scenarios:
         print("No scenarios found in destination team.")
         return
+    coros = []
     for scenario in scenarios:
         scenario_id = scenario.get("guid") or scenario.get("identifier")
         name = scenario.get("name", "Unnamed")
         if not scenario_id:
             continue
-        del_url = f"{BASE_URL}/scenarios/{scenario_id}?teamId={team_id}"
-        del_resp = requests.delete(del_url, headers=headers)
-        if del_resp.status_code in (200, 204):
-            print(f"Deleted scenario: {name}")
-        else:
-            print(f"Failed to delete scenario '{name}': {del_resp.status_code} {del_resp.text}")
+        coros.append(_delete_scenario(client, team_params, headers, scenario_id, name))
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    _report_errors(results, "deleting scenarios")
 
-def copy_external_integrations(source_team_id, dest_team_id, source_headers, dest_headers):
+def _integration_key(integ):
+    integ_type = integ.get("type") or integ.get("observabilityToolType") or "CUSTOM"
+    return (integ.get("name"), integ_type.upper(), integ.get("domain"))
+
+async def copy_external_integrations(client, source_team_id, dest_team_id, src_integrations, dest_headers, dst_integrations):
     print(f"\n--- Copying External Integrations from source team {source_team_id} ---")
-    src_integrations = get_external_integrations(source_team_id, source_headers)
     print(f"Found {len(src_integrations)} external integrations in source team {source_team_id}.")
-    dst_integrations = get_external_integrations(dest_team_id, dest_headers)
-    dst_names = {integ.get("name") for integ in dst_integrations if integ}
+    # Integrations with the same name can differ by type/domain, so dedup on all three.
+    dst_keys = {_integration_key(integ) for integ in dst_integrations if integ}
+    dst_integrations = list(dst_integrations)
+    # Integrations whose create call returned no body, described from what we sent.
+    unreturned = []
     
     for integ in src_integrations:
         if integ is None:
             continue
         name = integ.get("name")
-        if name in dst_names:
+        src_key = _integration_key(integ)
+        if src_key in dst_keys:
             print(f"Destination already has integration '{name}'.")
         else:
             # Build query parameters.
             qparams = {"teamId": dest_team_id}
-            source_type = integ.get("type", "CUSTOM")
-            if source_type:
-                source_type = source_type.upper()
-            else:
-                source_type = "CUSTOM"
+            source_type = src_key[1]
             if source_type == "CUSTOM":
                 qparams["observabilityToolType"] = "CUSTOM"
             else:
@@ -109,145 +250,207 @@ def copy_external_integrations(source_team_id, dest_team_id, source_headers, des
                 "lastAuthenticationStatus": integ.get("lastAuthenticationStatus", "AUTHENTICATED"),
                 "privateNetwork": integ.get("privateNetwork", False)
             }
-            post_url = f"{BASE_URL}/external-integrations/status-check"
-            post_resp = requests.post(post_url, headers=dest_headers, params=qparams, json=body)
+            post_resp = await _request(client, "POST", _EXTERNAL_INTEGRATIONS_URL, headers=dest_headers, params=qparams,
+                                       content=orjson.dumps(body))
             if post_resp.status_code in (200, 201):
+                # Track the created integration locally instead of re-fetching the destination list.
+                dst_keys.add(src_key)
+                try:
+                    created = _load_json(post_resp.content)
+                except orjson.JSONDecodeError:
+                    created = None
+                if isinstance(created, dict) and created:
+                    dst_integrations.append(created)
+                else:
+                    unreturned.append({**body, "type": source_type, "domain": integ.get("domain")})
                 print(f"Created integration '{name}' in destination team.")
             else:
                 print(f"Failed to create integration '{name}': {post_resp.status_code} {post_resp.text}")
-    dst_integrations = get_external_integrations(dest_team_id, dest_headers)
+    # Only go back to the API if a create call didn't return the new integration; one
+    # unfiltered fetch covers every such create. If that fetch fails, keep the local list
+    # rather than losing the integrations we already know about.
+    if unreturned:
+        refetched = await get_external_integrations(client, dest_team_id, dest_headers)
+        if refetched is None:
+            dst_integrations.extend(unreturned)
+        else:
+            dst_integrations = refetched
     return dst_integrations
 
-def copy_health_checks(source_team_id, target_team_id, source_headers, dest_headers, dest_integrations):
-    print(f"\nFetching health checks from source team {source_team_id}...")
-    url = f"{BASE_URL}/status-checks?teamId={source_team_id}"
-    resp = requests.get(url, headers=source_headers)
-    if resp.status_code != 200:
-        print(f"Error fetching source health checks: {resp.text}")
-        return {}
-    checks = resp.json()
+def _fields_applied(sent, stored):
+    # True when every field we sent comes back unchanged in the server's copy of the object.
+    if isinstance(sent, dict):
+        return isinstance(stored, dict) and all(_fields_applied(v, stored.get(k)) for k, v in sent.items())
+    return sent == stored
+
+async def _create_health_check(client, team_params, dest_headers, src_id, new_check):
+    # Returns (src_id, dest_id) so the caller can build the id mapping.
+    name = new_check.get("name", "Unnamed")
+    # Serialize once; the same bytes are reused if the follow-up PUT is needed.
+    payload = orjson.dumps(new_check)
+    post_resp = await _request(client, "POST", _STATUS_CHECKS_URL, headers=dest_headers, params=team_params,
+                               content=payload)
+    if post_resp.status_code not in (200, 201):
+        print(f"Failed to copy health check {name}: {post_resp.status_code} {post_resp.text}")
+        return None
+    try:
+        created = _load_json(post_resp.content)
+        dest_id = created.get("identifier")
+    except Exception:
+        created = None
+        dest_id = post_resp.text.strip()
+    if not dest_id:
+        print(f"Copied health check: {name} (identifier not returned)")
+        return None
+    # The PUT only exists to re-apply fields the create call drops; skip it when the
+    # created check already reflects everything we sent.
+    if _fields_applied(new_check, created):
+        print(f"Copied health check: {name}")
+        return src_id, dest_id
+    put_resp = await _request(client, "PUT", f"{_STATUS_CHECKS_URL}/{dest_id}", headers=dest_headers,
+                              params=team_params, content=payload)
+    if put_resp.status_code in (200, 201):
+        print(f"Copied and updated health check: {name}")
+    else:
+        print(f"Copied health check but failed to update {name}: {put_resp.status_code} {put_resp.text}")
+    return src_id, dest_id
+
+async def copy_health_checks(client, source_team_id, target_team_id, checks, dest_headers, dest_integrations):
+    print(f"\nCopying health checks from source team {source_team_id}...")
     if not checks:
         print("No health checks found in source team.")
         return {}
     
-    id_mapping = {}
+    # Index destination integrations once instead of scanning the list for every check.
+    # Several can share a name, so link by (name, type, domain); the by-name index is only
+    # a fallback for source links that carry no type or domain.
+    dest_by_key = {}
+    dest_by_name = {}
+    for d in dest_integrations or []:
+        if d and d.get("name"):
+            dest_by_key.setdefault(_integration_key(d), d)
+            dest_by_name.setdefault(d.get("name"), d)
+
+    team_params = {"teamId": target_team_id}
+    coros = []
     for check in checks:
         src_id = check.get("identifier")
-        new_check = check.copy()
+        new_check = {k: v for k, v in check.items() if k not in _HC_STRIP}
         # If endpointConfiguration is empty, try using rawEndpointConfiguration headers.
-        raw_ep = new_check.get("rawEndpointConfiguration", {})
+        raw_ep = check.get("rawEndpointConfiguration", {})
         ep = new_check.get("endpointConfiguration", {})
         if raw_ep and (not ep.get("headers") or not ep["headers"]):
             ep["headers"] = raw_ep.get("headers", {})
             new_check["endpointConfiguration"] = ep
-        for field in ["teamId", "identifier", "createdBy", "createdAt", "updatedBy", "updatedAt", "thirdPartyPresets", "rawEndpointConfiguration"]:
-            new_check.pop(field, None)
         # Process external integration.
         if "teamExternalIntegration" in new_check:
             src_integ = new_check["teamExternalIntegration"]
             src_name = src_integ.get("name")
             matched = None
-            if dest_integrations and src_name:
-                for d_integ in dest_integrations:
-                    if d_integ.get("name") == src_name:
-                        if d_integ.get("type", "").upper() == "CUSTOM":
-                            matched = {
-                                "observabilityToolType": "CUSTOM",
-                                "domain": d_integ.get("domain"),
-                                "name": d_integ.get("name")
-                            }
-                        else:
-                            matched = {
-                                "type": d_integ.get("type"),
-                                "domain": d_integ.get("domain"),
-                                "name": d_integ.get("name")
-                            }
-                        break
+            d_integ = None
+            if src_name:
+                # Prefer the exact (name, type, domain) match; fall back to the name when the link
+                # carries no type/domain or the destination's copy differs in one of them.
+                if (src_integ.get("type") or src_integ.get("observabilityToolType")
+                        or src_integ.get("domain") is not None):
+                    d_integ = dest_by_key.get(_integration_key(src_integ))
+                if d_integ is None:
+                    d_integ = dest_by_name.get(src_name)
+            if d_integ:
+                if (d_integ.get("type") or "CUSTOM").upper() == "CUSTOM":
+                    matched = {
+                        "observabilityToolType": "CUSTOM",
+                        "domain": d_integ.get("domain"),
+                        "name": d_integ.get("name")
+                    }
+                else:
+                    matched = {
+                        "type": d_integ.get("type"),
+                        "domain": d_integ.get("domain"),
+                        "name": d_integ.get("name")
+                    }
             if matched:
                 new_check["teamExternalIntegration"] = matched
             else:
+                print(f"Warning: external integration '{src_name}' not found in destination team; "
+                      f"removing it from health check '{new_check.get('name', 'Unnamed')}'.")
                 new_check.pop("teamExternalIntegration", None)
         new_check["teamId"] = target_team_id
+        coros.append(_create_health_check(client, team_params, dest_headers, src_id, new_check))
 
-        post_url = f"{BASE_URL}/status-checks?teamId={target_team_id}"
-        post_resp = requests.post(post_url, headers=dest_headers, json=new_check)
-        if post_resp.status_code in (200, 201):
-            try:
-                created = post_resp.json()
-                dest_id = created.get("identifier")
-            except Exception:
-                dest_id = post_resp.text.strip()
-            if dest_id:
-                id_mapping[src_id] = dest_id
-                put_url = f"{BASE_URL}/status-checks/{dest_id}?teamId={target_team_id}"
-                put_resp = requests.put(put_url, headers=dest_headers, json=new_check)
-                if put_resp.status_code in (200, 201):
-                    print(f"Copied and updated health check: {new_check.get('name', 'Unnamed')}")
-                else:
-                    print(f"Copied health check but failed to update {new_check.get('name', 'Unnamed')}: {put_resp.status_code} {put_resp.text}")
-            else:
-                print(f"Copied health check: {new_check.get('name', 'Unnamed')} (identifier not returned)")
-        else:
-            print(f"Failed to copy health check {new_check.get('name', 'Unnamed')}: {post_resp.status_code} {post_resp.text}")
+    id_mapping = {}
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    _report_errors(results, "copying health checks")
+    for result in results:
+        if isinstance(result, tuple):
+            src_id, dest_id = result
+            id_mapping[src_id] = dest_id
     return id_mapping
 
-def recursive_update_status_check(obj, mapping):
-    if isinstance(obj, dict):
-        for key in list(obj.keys()):
-            if key == "statusCheckId":
-                val = obj[key]
-                if isinstance(val, list):
-                    new_list = []
-                    for item in val:
-                        if item in mapping:
-                            new_list.append(mapping[item])
-                        else:
-                            print(f"Warning: health check id '{item}' not found in mapping; removing it from scenario.")
-                    if new_list:
-                        obj[key] = new_list
-                    else:
-                        obj.pop(key)
-                else:
-                    if val in mapping:
-                        obj[key] = mapping[val]
-                    else:
-                        print(f"Warning: health check id '{val}' not found in mapping; removing it from scenario.")
-                        obj.pop(key)
+_MISSING = object()
+
+def _remap_status_check_id(obj, val, mapping):
+    if isinstance(val, list):
+        new_list = []
+        for item in val:
+            new_id = mapping.get(item, _MISSING)
+            if new_id is _MISSING:
+                print(f"Warning: health check id '{item}' not found in mapping; removing it from scenario.")
             else:
-                recursive_update_status_check(obj[key], mapping)
-    elif isinstance(obj, list):
-        for item in obj:
-            recursive_update_status_check(item, mapping)
-    return obj
-
-def copy_scenarios(source_team_id, target_team_id, source_headers, dest_headers, hc_mapping):
-    print(f"\nFetching scenarios from source team {source_team_id}...")
-    url = f"{BASE_URL}/scenarios?teamId={source_team_id}"
-    resp = requests.get(url, headers=source_headers)
-    if resp.status_code != 200:
-        print(f"Error fetching scenarios for team {source_team_id}: {resp.text}")
-        return
-    scenarios = resp.json()
+                new_list.append(new_id)
+        if new_list:
+            obj["statusCheckId"] = new_list
+        else:
+            obj.pop("statusCheckId")
+    else:
+        new_id = mapping.get(val, _MISSING)
+        if new_id is _MISSING:
+            print(f"Warning: health check id '{val}' not found in mapping; removing it from scenario.")
+            obj.pop("statusCheckId")
+        else:
+            obj["statusCheckId"] = new_id
+
+def update_status_check_ids(root, mapping):
+    # Walk the scenario with an explicit stack rather than recursion so deeply nested
+    # scenarios can't hit the interpreter's recursion limit.
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            val = obj.get("statusCheckId", _MISSING)
+            if val is not _MISSING:
+                _remap_status_check_id(obj, val, mapping)
+            for key, value in obj.items():
+                if key != "statusCheckId" and isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(obj, list):
+            stack.extend(item for item in obj if isinstance(item, (dict, list)))
+    return root
+
+async def _create_scenario(client, team_params, dest_headers, new_scenario):
+    name = new_scenario.get("name", "Unnamed")
+    post_resp = await _request(client, "POST", _SCENARIOS_URL, headers=dest_headers, params=team_params,
+                               content=orjson.dumps(new_scenario))
+    if post_resp.status_code in (200, 201):
+        print(f"Copied scenario: {name}")
+    else:
+        print(f"Failed to copy scenario {name}: {post_resp.status_code} {post_resp.text}")
+
+async def copy_scenarios(client, source_team_id, target_team_id, scenarios, dest_headers, hc_mapping):
+    print(f"\nCopying scenarios from source team {source_team_id}...")
     if not scenarios:
         print("No scenarios found in source team.")
         return
 
+    team_params = {"teamId": target_team_id}
+    coros = []
     for scenario in scenarios:
-        new_scenario = scenario.copy()
-        # Remove system fields and shared linkage fields so the scenario is treated as a standalone, customized scenario.
-        for field in ["teamId", "identifier", "createdBy", "createdAt", "updatedBy", "updatedAt",
-                      "sharedScenario", "sharedScenarioGuid", "baseScenarioId",
-                      "created_from_type", "created_from_id", "org_id"]:
-            new_scenario.pop(field, None)
-        new_scenario = recursive_update_status_check(new_scenario, hc_mapping)
+        new_scenario = {k: v for k, v in scenario.items() if k not in _SCEN_STRIP}
+        new_scenario = update_status_check_ids(new_scenario, hc_mapping)
         new_scenario["teamId"] = target_team_id
-
-        post_url = f"{BASE_URL}/scenarios?teamId={target_team_id}"
-        post_resp = requests.post(post_url, headers=dest_headers, json=new_scenario)
-        if post_resp.status_code in (200, 201):
-            print(f"Copied scenario: {new_scenario.get('name', 'Unnamed')}")
-        else:
-            print(f"Failed to copy scenario {new_scenario.get('name', 'Unnamed')}: {post_resp.status_code} {post_resp.text}")
+        coros.append(_create_scenario(client, team_params, dest_headers, new_scenario))
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    _report_errors(results, "copying scenarios")
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -261,6 +464,65 @@ def parse_args():
     parser.add_argument("--delete-scenarios", action="store_true", help="Delete existing scenarios in destination team")
     return parser.parse_args()
 
+async def run_migration(source_team_ids, target_team_id, source_headers, dest_headers,
+                        delete_health_checks=False, delete_scenarios=False):
+    # One HTTP/2 client for the whole run: requests to api.gremlin.com are multiplexed over
+    # a shared TLS connection. Auth differs between source and destination, so it is passed per call.
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=30.0,
+                                 headers={"Content-Type": "application/json"}) as http:
+        client = GremlinClient(http)
+        # Optionally delete existing health checks and scenarios.
+        if delete_health_checks:
+            await delete_existing_health_checks(client, target_team_id, dest_headers)
+        if delete_scenarios:
+            await delete_existing_scenarios(client, target_team_id, dest_headers)
+
+        overall_hc_mapping = {}
+        dest_integrations = None
+        # Process each source team.
+        for src_team in source_team_ids:
+            print(f"\n=== Processing source team {src_team} ===")
+            # The source reads (and the first destination integrations read) are independent,
+            # so issue them together instead of one round trip at a time.
+            fetches = [
+                get_external_integrations(client, src_team, source_headers),
+                get_status_checks(client, src_team, source_headers),
+                get_scenarios(client, src_team, source_headers),
+            ]
+            if dest_integrations is None:
+                fetches.append(get_external_integrations(client, target_team_id, dest_headers))
+            fetched = await asyncio.gather(*fetches)
+            src_integrations, src_checks, src_scenarios = fetched[:3]
+            dest_known = True
+            if dest_integrations is None:
+                dest_integrations = fetched[3]
+                dest_known = dest_integrations is not None
+
+            if dest_known:
+                dest_integrations = await copy_external_integrations(client, src_team, target_team_id,
+                                                                     src_integrations or [], dest_headers,
+                                                                     dest_integrations)
+            else:
+                # Without the destination list we can't tell which integrations already exist,
+                # so creating them here would risk duplicates.
+                print("Skipping external integrations: could not fetch the destination team's integrations.")
+                dest_integrations = []
+            if dest_integrations:
+                print(f"Destination team now has {len(dest_integrations)} external integrations for status checks.")
+            else:
+                print("No external integrations present in destination team after attempted copy.")
+
+            hc_mapping = await copy_health_checks(client, src_team, target_team_id, src_checks, dest_headers, dest_integrations)
+            overall_hc_mapping.update(hc_mapping)
+            await copy_scenarios(client, src_team, target_team_id, src_scenarios, dest_headers, overall_hc_mapping)
+            if not dest_known:
+                # The destination list couldn't be fetched, so don't carry this team's partial view
+                # forward; the next source team fetches it again.
+                dest_integrations = None
+
+    print("\nFinished replicating health checks, integrations, and scenarios.")
+
 def main():
     # If no command-line args are provided, print help and exit.
     if len(sys.argv) == 1:
@@ -283,33 +545,12 @@ def main():
         print("Destination API key is required.")
         sys.exit(1)
     
-    source_headers = {"Authorization": f"Key {source_api_key}", "Content-Type": "application/json"}
-    dest_headers = {"Authorization": f"Key {dest_api_key}", "Content-Type": "application/json"}
-    
-    source_team_ids = args.source_team_ids
-    target_team_id = args.target_team_id
-    
-    # Optionally delete existing health checks and scenarios.
-    if args.delete_health_checks:
-        delete_existing_health_checks(target_team_id, dest_headers)
-    if args.delete_scenarios:
-        delete_existing_scenarios(target_team_id, dest_headers)
+    # Content-Type is set once on the shared client; only the auth key differs per side.
+    source_headers = {"Authorization": f"Key {source_api_key}"}
+    dest_headers = {"Authorization": f"Key {dest_api_key}"}
     
-    overall_hc_mapping = {}
-    # Process each source team.
-    for src_team in source_team_ids:
-        print(f"\n=== Processing source team {src_team} ===")
-        dest_integrations = copy_external_integrations(src_team, target_team_id, source_headers, dest_headers)
-        if dest_integrations:
-            print(f"Destination team now has {len(dest_integrations)} external integrations for status checks.")
-        else:
-            print("No external integrations present in destination team after attempted copy.")
-    
-        hc_mapping = copy_health_checks(src_team, target_team_id, source_headers, dest_headers, dest_integrations)
-        overall_hc_mapping.update(hc_mapping)
-        copy_scenarios(src_team, target_team_id, source_headers, dest_headers, overall_hc_mapping)
-    
-    print("\nFinished replicating health checks, integrations, and scenarios.")
+    asyncio.run(run_migration(args.source_team_ids, args.target_team_id, source_headers, dest_headers,
+                              args.delete_health_checks, args.delete_scenarios))
 
 if __name__ == "__main__":
     main()